@@ -5,7 +5,6 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 import uvicorn
 import os
-import json
 import logging
 from typing import List, Optional
 import uuid
@@ -16,7 +15,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import our modules
-from src.models.database import get_db, create_tables, JobDescription, Resume, ResumeEvaluation
+from src.models.database import get_db, create_tables, dumps_json, loads_json, JobDescription, Resume, ResumeEvaluation
 from src.parsers.resume_parser import ResumeParser
 from src.parsers.jd_parser import JobDescriptionParser
 from src.matching.hard_matching import HardMatching
@@ -109,7 +108,7 @@ async def upload_job_description(
             raise HTTPException(status_code=400, detail="Could not extract text from file")
         
         # Parse job description
-        parsed_jd = jd_parser.parse_job_description(raw_text)
+        parsed_jd = await jd_parser.parse_job_description_async(raw_text)
         
         # Create database record
         jd_record = JobDescription(
@@ -117,10 +116,10 @@ async def upload_job_description(
             company=company or parsed_jd.get("company_info", {}).get("name", ""),
             location=location or parsed_jd.get("company_info", {}).get("location", ""),
             raw_text=raw_text,
-            parsed_requirements=json.dumps(parsed_jd),
-            must_have_skills=json.dumps(parsed_jd.get("required_skills", [])),
-            good_to_have_skills=json.dumps(parsed_jd.get("preferred_skills", [])),
-            qualifications=json.dumps(parsed_jd.get("qualifications", []))
+            parsed_requirements=dumps_json(parsed_jd),
+            must_have_skills=dumps_json(parsed_jd.get("required_skills", [])),
+            good_to_have_skills=dumps_json(parsed_jd.get("preferred_skills", [])),
+            qualifications=dumps_json(parsed_jd.get("qualifications", []))
         )
         
         db.add(jd_record)
@@ -174,12 +173,12 @@ async def upload_resume(
             student_name=student_name or parsed_resume.get("contact_info", {}).get("name", ""),
             student_email=student_email or parsed_resume.get("contact_info", {}).get("email", ""),
             raw_text=parsed_resume["raw_text"],
-            parsed_content=json.dumps(parsed_resume),
-            skills=json.dumps(parsed_resume.get("skills", [])),
-            education=json.dumps(parsed_resume.get("education", [])),
-            experience=json.dumps(parsed_resume.get("experience", [])),
-            projects=json.dumps(parsed_resume.get("projects", [])),
-            certifications=json.dumps(parsed_resume.get("certifications", []))
+            parsed_content=dumps_json(parsed_resume),
+            skills=dumps_json(parsed_resume.get("skills", [])),
+            education=dumps_json(parsed_resume.get("education", [])),
+            experience=dumps_json(parsed_resume.get("experience", [])),
+            projects=dumps_json(parsed_resume.get("projects", [])),
+            certifications=dumps_json(parsed_resume.get("certifications", []))
         )
         
         db.add(resume_record)
@@ -218,8 +217,8 @@ async def evaluate_resume(
             raise HTTPException(status_code=404, detail="Job description not found")
         
         # Parse the stored data
-        resume_data = json.loads(resume_record.parsed_content)
-        jd_data = json.loads(jd_record.parsed_requirements)
+        resume_data = loads_json(resume_record.parsed_content)
+        jd_data = loads_json(jd_record.parsed_requirements)
         
         # Perform hard matching
         hard_match_results = hard_matcher.calculate_hard_match_score(resume_data, jd_data)
@@ -240,11 +239,11 @@ async def evaluate_resume(
             verdict=analysis["verdict"],
             hard_match_score=hard_match_results.get("hard_match_score", 0.0),
             semantic_match_score=semantic_match_results.get("semantic_score", 0.0),
-            missing_skills=json.dumps(analysis["missing_elements"].get("skills", [])),
-            missing_certifications=json.dumps(analysis["missing_elements"].get("certifications", [])),
-            missing_projects=json.dumps(analysis["missing_elements"].get("projects", [])),
-            improvement_suggestions=json.dumps(analysis["improvement_suggestions"]),
-            evaluation_details=json.dumps(analysis)
+            missing_skills=dumps_json(analysis["missing_elements"].get("skills", [])),
+            missing_certifications=dumps_json(analysis["missing_elements"].get("certifications", [])),
+            missing_projects=dumps_json(analysis["missing_elements"].get("projects", [])),
+            improvement_suggestions=dumps_json(analysis["improvement_suggestions"]),
+            evaluation_details=dumps_json(analysis)
         )
         
         db.add(evaluation_record)
@@ -306,8 +305,8 @@ async def get_results(
                 "job_title": jd.title if jd else "Unknown",
                 "company": jd.company if jd else "Unknown",
                 "evaluation_date": eval_record.created_at.isoformat(),
-                "missing_skills": json.loads(eval_record.missing_skills or "[]"),
-                "improvement_suggestions": json.loads(eval_record.improvement_suggestions or "[]")
+                "missing_skills": loads_json(eval_record.missing_skills or "[]"),
+                "improvement_suggestions": loads_json(eval_record.improvement_suggestions or "[]")
             }
             results.append(result)
         
@@ -337,8 +336,8 @@ async def get_evaluations(db: Session = Depends(get_db)):
                 "hard_match_score": eval_record.hard_match_score,
                 "semantic_match_score": eval_record.semantic_match_score,
                 "evaluation_date": eval_record.created_at.isoformat(),
-                "missing_skills": json.loads(eval_record.missing_skills or "[]"),
-                "improvement_suggestions": json.loads(eval_record.improvement_suggestions or "[]")
+                "missing_skills": loads_json(eval_record.missing_skills or "[]"),
+                "improvement_suggestions": loads_json(eval_record.improvement_suggestions or "[]")
             }
             results.append(result)
         
@@ -405,7 +404,7 @@ async def get_resumes(limit: int = 50, db: Session = Depends(get_db)):
                 "student_name": resume.student_name,
                 "student_email": resume.student_email,
                 "upload_date": resume.created_at.isoformat(),
-                "skills": json.loads(resume.skills or "[]")
+                "skills": loads_json(resume.skills or "[]")
             }
             results.append(result)
         
@@ -429,7 +428,7 @@ async def get_job_descriptions(limit: int = 50, db: Session = Depends(get_db)):
                 "company": jd.company,
                 "location": jd.location,
                 "upload_date": jd.created_at.isoformat(),
-                "required_skills": json.loads(jd.must_have_skills or "[]")
+                "required_skills": loads_json(jd.must_have_skills or "[]")
             }
             results.append(result)
         
@@ -439,4 +438,6 @@ async def get_job_descriptions(limit: int = 50, db: Session = Depends(get_db)):
         logger.error(f"Error getting job descriptions: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving job descriptions: {str(e)}")
 
-
+if __name__ == "__main__":
+    # Serve the already imported app in this process instead of having uvicorn import it again
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")), log_level="info")
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 import os
+from importlib.util import find_spec
 import streamlit as st
 from dashboard import main as dashboard_main
 
+def check_spacy_model():
+    """Check that the spaCy model package is installed without importing spaCy or loading it"""
+    return find_spec("en_core_web_sm") is not None
+
 def install_spacy_model():
-    try:
-        import spacy
-        spacy.load("en_core_web_sm")
+    # The parsers load the model themselves on first use
+    if check_spacy_model():
         print("✅ spaCy model ready")
-    except Exception as e:
-        print("❌ spaCy model error:", e)
+    else:
+        print("❌ spaCy model error: en_core_web_sm is not installed")
 
 def main():
     print("🎯 Resume Evaluation System - Streamlit Deployment")
@@ -1,14 +1,51 @@
+import json
 import re
+import numpy as np
 from typing import Dict, List, Tuple, Any
 from fuzzywuzzy import fuzz, process
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import logging
 
+try:
+    from ..utils.cache import DigestCache
+    from ..utils.skills import normalize_skills
+except ImportError:
+    # Imported as a top-level package with src/ on sys.path (tests)
+    from utils.cache import DigestCache
+    from utils.skills import normalize_skills
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Degree levels and fields of study compared by education_match
+_DEGREE_LEVELS = ('bachelor', 'master', 'phd', 'diploma')
+_DEGREE_FIELDS = ('computer', 'engineering', 'technology', 'software', 'it')
+
+# Experience levels in ascending order of years
+_EXPERIENCE_LEVELS = np.array(['entry_level', 'mid_level', 'senior_level', 'principal_level'])
+
+# Title words used to guess experience when a role has no stated duration
+_SENIOR_TITLE_KEYWORDS = ('senior', 'lead', 'principal')
+_JUNIOR_TITLE_KEYWORDS = ('junior', 'entry', 'fresher')
+
+# Skill words that mark a job description requirement as a certification
+_CERT_KEYWORDS = ('certified', 'certification', 'certificate', 'aws', 'azure', 'gcp', 'pmp', 'scrum')
+
+# Duration units in a single pass; match.lastgroup identifies the unit that matched
+_DURATION_RE = re.compile('|'.join([
+    r'(?P<years>\d+)\s*(?:years?|yrs?)',
+    r'(?P<months>\d+)\s*(?:months?|mos?)',
+    r'(?P<days>\d+)\s*(?:days?|d)'
+]))
+
+# A year count beats a month count, which beats a day count
+_DURATION_PRIORITY = {'years': 0, 'months': 1, 'days': 2}
+
+# Number of hard match results kept per matcher instance
+_SCORE_CACHE_SIZE = 128
+
 class HardMatching:
     def __init__(self):
         """Initialize hard matching with TF-IDF vectorizer"""
@@ -16,22 +53,25 @@ class HardMatching:
             max_features=1000,
             stop_words='english',
             ngram_range=(1, 2),
-            lowercase=True
+            lowercase=True,
+            dtype=np.float32
         )
+        self._cache = DigestCache(_SCORE_CACHE_SIZE)
     
-    def exact_keyword_match(self, resume_skills: List[str], jd_skills: List[str]) -> Dict[str, Any]:
+    def exact_keyword_match(self, resume_skills: List[str], jd_skills: List[str], normalized: bool = False) -> Dict[str, Any]:
         """Perform exact keyword matching between resume and job description skills"""
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        jd_skills_lower = [skill.lower() for skill in jd_skills]
+        if normalized:
+            resume_skills_lower, jd_skills_lower = resume_skills, jd_skills
+        else:
+            resume_skills_lower = [skill.lower() for skill in resume_skills]
+            jd_skills_lower = [skill.lower() for skill in jd_skills]
+        resume_skill_set = set(resume_skills_lower)
         
         # Find exact matches
-        exact_matches = []
-        for jd_skill in jd_skills_lower:
-            if jd_skill in resume_skills_lower:
-                exact_matches.append(jd_skill)
+        exact_matches = [skill for skill in jd_skills_lower if skill in resume_skill_set]
         
         # Find missing skills
-        missing_skills = [skill for skill in jd_skills_lower if skill not in resume_skills_lower]
+        missing_skills = [skill for skill in jd_skills_lower if skill not in resume_skill_set]
         
         # Calculate exact match score
         exact_match_score = len(exact_matches) / len(jd_skills_lower) if jd_skills_lower else 0
@@ -44,10 +84,13 @@ class HardMatching:
             "matched_skills_count": len(exact_matches)
         }
     
-    def fuzzy_keyword_match(self, resume_skills: List[str], jd_skills: List[str], threshold: int = 80) -> Dict[str, Any]:
+    def fuzzy_keyword_match(self, resume_skills: List[str], jd_skills: List[str], threshold: int = 80, normalized: bool = False) -> Dict[str, Any]:
         """Perform fuzzy keyword matching with similarity threshold"""
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        jd_skills_lower = [skill.lower() for skill in jd_skills]
+        if normalized:
+            resume_skills_lower, jd_skills_lower = resume_skills, jd_skills
+        else:
+            resume_skills_lower = [skill.lower() for skill in resume_skills]
+            jd_skills_lower = [skill.lower() for skill in jd_skills]
         
         fuzzy_matches = []
         partial_matches = []
@@ -102,8 +145,8 @@ class HardMatching:
             
             for resume_degree in resume_degrees:
                 # Check for degree level matches
-                if any(level in resume_degree for level in ['bachelor', 'master', 'phd', 'diploma']):
-                    if any(level in jd_qual_lower for level in ['bachelor', 'master', 'phd', 'diploma']):
+                if any(level in resume_degree for level in _DEGREE_LEVELS):
+                    if any(level in jd_qual_lower for level in _DEGREE_LEVELS):
                         education_matches.append({
                             "jd_qualification": jd_qual,
                             "resume_degree": resume_degree,
@@ -114,8 +157,8 @@ class HardMatching:
                         break
                 
                 # Check for field matches
-                if any(field in resume_degree for field in ['computer', 'engineering', 'technology', 'software', 'it']):
-                    if any(field in jd_qual_lower for field in ['computer', 'engineering', 'technology', 'software', 'it']):
+                if any(field in resume_degree for field in _DEGREE_FIELDS):
+                    if any(field in jd_qual_lower for field in _DEGREE_FIELDS):
                         education_matches.append({
                             "jd_qualification": jd_qual,
                             "resume_degree": resume_degree,
@@ -188,6 +231,11 @@ class HardMatching:
             "jd_requirements": jd_experience_req
         }
     
+    def classify_experience_batch(self, years: np.ndarray) -> np.ndarray:
+        """Classify many experience estimates at once, matching experience_match levels"""
+        # right=True keeps the <=2 / <=5 / <=8 boundaries used by experience_match
+        return _EXPERIENCE_LEVELS[np.digitize(years, [2, 5, 8], right=True)]
+    
     def _estimate_experience_years(self, resume_experience: List[Dict]) -> int:
         """Estimate years of experience from resume"""
         total_years = 0
@@ -197,28 +245,24 @@ class HardMatching:
                 duration = exp['duration'].lower()
                 
                 # Extract years from duration text
-                year_patterns = [
-                    r'(\d+)\s*(?:years?|yrs?)',
-                    r'(\d+)\s*(?:months?|mos?)',
-                    r'(\d+)\s*(?:days?|d)'
-                ]
-                
-                for pattern in year_patterns:
-                    matches = re.findall(pattern, duration)
-                    if matches:
-                        years = int(matches[0])
-                        if 'month' in duration:
-                            years = years / 12
-                        elif 'day' in duration:
-                            years = years / 365
-                        total_years += years
-                        break
+                match = min(
+                    _DURATION_RE.finditer(duration),
+                    key=lambda m: _DURATION_PRIORITY[m.lastgroup],
+                    default=None
+                )
+                if match:
+                    years = int(match[match.lastgroup])
+                    if 'month' in duration:
+                        years = years / 12
+                    elif 'day' in duration:
+                        years = years / 365
+                    total_years += years
                 else:
                     # If no duration found, estimate based on title
                     title = exp.get('title', '').lower()
-                    if any(keyword in title for keyword in ['senior', 'lead', 'principal']):
+                    if any(keyword in title for keyword in _SENIOR_TITLE_KEYWORDS):
                         total_years += 3
-                    elif any(keyword in title for keyword in ['junior', 'entry', 'fresher']):
+                    elif any(keyword in title for keyword in _JUNIOR_TITLE_KEYWORDS):
                         total_years += 1
                     else:
                         total_years += 2  # Default assumption
@@ -235,8 +279,7 @@ class HardMatching:
         jd_skills_lower = [skill.lower() for skill in jd_skills]
         
         # Look for certification-related skills in JD
-        cert_keywords = ['certified', 'certification', 'certificate', 'aws', 'azure', 'gcp', 'pmp', 'scrum']
-        jd_cert_requirements = [skill for skill in jd_skills_lower if any(keyword in skill for keyword in cert_keywords)]
+        jd_cert_requirements = [skill for skill in jd_skills_lower if any(keyword in skill for keyword in _CERT_KEYWORDS)]
         
         for jd_cert in jd_cert_requirements:
             matched = False
@@ -277,6 +320,14 @@ class HardMatching:
     
     def tfidf_similarity(self, resume_text: str, jd_text: str) -> float:
         """Calculate TF-IDF based similarity between resume and job description"""
+        # Skip vectorization for trivial inputs
+        if not resume_text or not jd_text:
+            return 0.0
+        if resume_text == jd_text:
+            return 1.0
+        if len(resume_text.split()) < 3 or len(jd_text.split()) < 3:
+            return 0.0
+        
         try:
             # Combine texts for vectorization
             texts = [resume_text, jd_text]
@@ -294,24 +345,38 @@ class HardMatching:
             return 0.0
     
     def calculate_hard_match_score(self, resume_data: Dict[str, Any], jd_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate overall hard match score, reusing results for identical inputs"""
+        try:
+            # Canonicalize inputs so equal dicts share a cache entry
+            key = DigestCache.key(json.dumps(resume_data, sort_keys=True), json.dumps(jd_data, sort_keys=True))
+        except (TypeError, ValueError):
+            return self._calculate_hard_match_score(resume_data, jd_data)
+        
+        return self._cache.get_or_compute(key, lambda: self._calculate_hard_match_score(resume_data, jd_data))
+    
+    def _calculate_hard_match_score(self, resume_data: Dict[str, Any], jd_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate overall hard match score"""
         try:
-            # Extract data
-            resume_skills = resume_data.get("skills", [])
+            # Extract data, preferring skills normalized at ingest time
+            resume_skills = resume_data.get("skills_norm")
+            if resume_skills is None:
+                resume_skills = normalize_skills(resume_data.get("skills", []))
             resume_education = resume_data.get("education", [])
             resume_experience = resume_data.get("experience", [])
             resume_certifications = resume_data.get("certifications", [])
             resume_text = resume_data.get("cleaned_text", "")
             
-            jd_required_skills = jd_data.get("required_skills", [])
+            jd_required_skills = jd_data.get("required_skills_norm")
+            if jd_required_skills is None:
+                jd_required_skills = normalize_skills(jd_data.get("required_skills", []))
             jd_preferred_skills = jd_data.get("preferred_skills", [])
             jd_qualifications = jd_data.get("qualifications", [])
             jd_experience_req = jd_data.get("experience_requirements", {})
             jd_text = jd_data.get("cleaned_text", "")
             
             # Perform different types of matching
-            exact_skill_match = self.exact_keyword_match(resume_skills, jd_required_skills)
-            fuzzy_skill_match = self.fuzzy_keyword_match(resume_skills, jd_required_skills)
+            exact_skill_match = self.exact_keyword_match(resume_skills, jd_required_skills, normalized=True)
+            fuzzy_skill_match = self.fuzzy_keyword_match(resume_skills, jd_required_skills, normalized=True)
             education_match = self.education_match(resume_education, jd_qualifications)
             experience_match = self.experience_match(resume_experience, jd_experience_req)
             certification_match = self.certification_match(resume_certifications, jd_required_skills)
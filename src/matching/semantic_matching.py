@@ -1,28 +1,32 @@
-import os
 import numpy as np
 from typing import Dict, List, Any, Optional
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import google.generativeai as genai
 import logging
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    from ..utils import config
+except ImportError:
+    # Imported as a top-level package with src/ on sys.path (tests)
+    from utils import config
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Required skills containing one of these words get a certification suggestion
+_CERT_KEYWORDS = ('aws', 'azure', 'gcp', 'certified', 'certification')
+
 class SemanticMatching:
     def __init__(self):
         """Initialize semantic matching with embedding model and Gemini client"""
         # Initialize Gemini client
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        self.gemini_model = genai.GenerativeModel(os.getenv("DEFAULT_MODEL", "gemini-pro"))
+        genai.configure(api_key=config.CONFIG.GOOGLE_API_KEY)
+        self.gemini_model = genai.GenerativeModel(config.CONFIG.DEFAULT_MODEL)
         
         # Initialize sentence transformer model
-        model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+        model_name = config.CONFIG.EMBEDDING_MODEL
         try:
             self.embedding_model = SentenceTransformer(model_name)
             logger.info(f"Loaded embedding model: {model_name}")
@@ -229,8 +233,7 @@ class SemanticMatching:
         
         # Certification suggestions
         jd_skills = jd_data.get("required_skills", [])
-        cert_keywords = ['aws', 'azure', 'gcp', 'certified', 'certification']
-        cert_requirements = [skill for skill in jd_skills if any(keyword in skill.lower() for keyword in cert_keywords)]
+        cert_requirements = [skill for skill in jd_skills if any(keyword in skill.lower() for keyword in _CERT_KEYWORDS)]
         
         if cert_requirements:
             suggestions.append(f"Consider obtaining certifications in: {', '.join(cert_requirements[:2])}")
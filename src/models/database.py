@@ -2,6 +2,8 @@ from sqlalchemy import create_engine, Column, Integer, String, Text, Float, Date
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
+from typing import Any
+import orjson
 import os
 
 # Database configuration
@@ -86,6 +88,15 @@ class EvaluationLog(Base):
     details = Column(Text)  # JSON string
     created_at = Column(DateTime, default=datetime.utcnow)
 
+# JSON column helpers
+def dumps_json(obj: Any) -> str:
+    """Serialize a value for storage in a JSON Text column"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+def loads_json(text: str) -> Any:
+    """Deserialize a value stored in a JSON Text column"""
+    return orjson.loads(text)
+
 # Create all tables
 def create_tables():
     Base.metadata.create_all(bind=engine)
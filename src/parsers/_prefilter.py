@@ -0,0 +1,74 @@
+import re
+import threading
+import logging
+from typing import Callable, Iterator, Sequence
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+# Ordered regex groups with an optional Hyperscan prefilter shared by the parsers
+
+# Characters Python's re treats differently from Hyperscan's Unicode tables in a way that could
+# make the prefilter reject a real match: the case folds of dotted/dotless i, the separators re
+# counts as whitespace, two Mongolian signs Hyperscan counts as word characters, and the
+# supplementary planes, where newer Unicode digits live. Lone surrogates cannot be encoded for
+# the scan at all. Text containing any of them skips the prefilter
+_UNSAFE_CHARS_RE = re.compile(r'[\x1c-\x1f\u0130\u0131\u1885\u1886\ud800-\udfff\U00010000-\U0010ffff]')
+
+class PrefilteredPatterns:
+    """An ordered group of regexes that skips the ones Hyperscan rules out in a single scan"""
+    
+    def __init__(self, patterns: Sequence[str], flags: int = 0, compiler: Callable = re.compile):
+        self.patterns = tuple(compiler(pattern, flags) for pattern in patterns)
+        self._database = None
+        self._local = threading.local()
+        if hyperscan is None:
+            return
+        
+        # Prefilter mode only promises a superset of the real matches, which is all that is
+        # needed here and lets Hyperscan accept constructs it cannot match exactly
+        # UCP gives \d, \s, \b and caseless matching Unicode semantics, as in re
+        hs_flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+                    | hyperscan.HS_FLAG_ALLOWEMPTY | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        if flags & re.IGNORECASE:
+            hs_flags |= hyperscan.HS_FLAG_CASELESS
+        if flags & re.MULTILINE:
+            hs_flags |= hyperscan.HS_FLAG_MULTILINE
+        if flags & re.DOTALL:
+            hs_flags |= hyperscan.HS_FLAG_DOTALL
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[pattern.encode('utf-8') for pattern in patterns],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=[hs_flags] * len(patterns)
+            )
+            self._database = database
+        except hyperscan.error as e:
+            logger.debug(f"Hyperscan prefilter disabled: {e}")
+    
+    def candidates(self, text: str) -> Iterator:
+        """Yield, in order, the patterns that may match the text"""
+        if self._database is None or _UNSAFE_CHARS_RE.search(text):
+            yield from self.patterns
+            return
+        
+        # Scratch space cannot be shared between concurrent scans, so keep one per thread
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+        
+        found = set()
+        self._database.scan(
+            text.encode('utf-8'),
+            match_event_handler=lambda pattern_id, start, end, flags, context: found.add(pattern_id),
+            scratch=scratch
+        )
+        for index, pattern in enumerate(self.patterns):
+            if index in found:
+                yield pattern
@@ -1,79 +1,319 @@
 import re
 import json
-from typing import Dict, List, Optional, Any
-import spacy
+import asyncio
+from typing import Dict, List, Optional, Tuple, Any
+import functools
 import logging
+from ._prefilter import PrefilteredPatterns
+from ._skills import build_skill_automaton, find_skills
+
+try:
+    from ..utils.cache import DigestCache
+    from ..utils.skills import normalize_skills
+except ImportError:
+    # Imported as a top-level package with src/ on sys.path (tests)
+    from utils.cache import DigestCache
+    from utils.skills import normalize_skills
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Characters re and RE2 classify differently: the control characters re counts as whitespace,
+# and non-ASCII word and whitespace characters, which RE2's ASCII-only \w, \d, \s and \b
+# reject and whose case folds (K, ſ, İ, ...) differ between the two. Lone surrogates cannot
+# be encoded for RE2 at all
+_RE2_UNSAFE_RE = re.compile(r'[\x0b\x1c-\x1f\ud800-\udfff]|[^\x00-\x7f\W]|[^\x00-\x7f\S]')
+
+@functools.lru_cache(maxsize=8)
+def _re2_safe(text: str) -> bool:
+    """Whether RE2 matches the text exactly as re would; checked once per text, not per pattern"""
+    return _RE2_UNSAFE_RE.search(text) is None
+
+class _Re2Pattern:
+    """A pattern compiled with both RE2 and re; text RE2 would read differently goes to re"""
+    
+    __slots__ = ('re2_pattern', 're_pattern')
+    
+    def __init__(self, re2_pattern, re_pattern: re.Pattern):
+        self.re2_pattern = re2_pattern
+        self.re_pattern = re_pattern
+    
+    def _select(self, text: str):
+        if _re2_safe(text):
+            return self.re2_pattern
+        return self.re_pattern
+    
+    def search(self, text: str):
+        return self._select(text).search(text)
+    
+    def findall(self, text: str):
+        return self._select(text).findall(text)
+    
+    def finditer(self, text: str):
+        return self._select(text).finditer(text)
+    
+    def sub(self, repl, text: str):
+        return self._select(text).sub(repl, text)
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 (linear-time matching) when available, otherwise with re"""
+    compiled = re.compile(pattern, flags)
+    if re2 is not None:
+        # RE2 takes flags inline rather than as re.RegexFlag values
+        inline = ''.join(letter for flag, letter in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm')) if flags & flag)
+        try:
+            return _Re2Pattern(re2.compile(f'(?{inline}){pattern}' if inline else pattern), compiled)
+        except re2.error:
+            logger.debug(f"Pattern not supported by RE2, using re: {pattern}")
+    return compiled
+
+# Precompiled patterns shared by all parser instances. Patterns that are run over
+# small windows of a larger string stay on re: the RE2 wrapper re-encodes the whole
+# string on every call.
+_PARENTHESES_RE = _compile(r'\([^)]*\)')
+# Bullet characters mapped to line breaks so bodies split with str.split
+_BULLET_TRANS = str.maketrans({'•': '\n', '-': '\n', '*': '\n'})
+
+# Common job posting headers/footers
+_HEADERS_RE = _compile(
+    r'\b(?:job description|job posting|career opportunity|we are hiring|join our team)\b',
+    re.IGNORECASE
+)
+
+# Enhanced patterns for job titles
+_TITLE_PATTERNS = PrefilteredPatterns([
+    r'(?:position|role|title|job|opening):\s*([^\n]+?)(?:\n|$)',
+    r'(?:we are looking for|seeking|hiring|recruiting)\s+(?:a|an)?\s*([^\n]+?)(?:\s+to|$|\n)',
+    r'^([A-Z][^.\n]{5,50}?)(?:\s+position|\s+role|\s+job|\n|$)',
+    r'(?:software|data|web|mobile|devops|cloud|ai|ml|backend|frontend|full.?stack)\s+(?:engineer|developer|analyst|scientist|architect|consultant|specialist)',
+    r'(?:senior|junior|lead|principal|staff|associate)\s+(?:software|data|web|mobile|devops|cloud|ai|ml|backend|frontend|full.?stack)\s+(?:engineer|developer|analyst|scientist|architect|consultant|specialist)',
+    r'(?:data\s+)?(?:engineer|developer|analyst|scientist|architect|consultant|specialist|intern)',
+    r'(?:python|java|javascript|react|angular|vue|node)\s+(?:developer|engineer)',
+    r'(?:machine learning|deep learning|ai|ml)\s+(?:engineer|developer|scientist|specialist)'
+], re.IGNORECASE | re.MULTILINE, _compile)
+
+# Job title words used by the first-lines fallback; substring matches, so "intern" also
+# covers "internship"
+_JOB_KEYWORD_RE = re.compile(r'engineer|developer|analyst|scientist|architect|consultant|manager|intern', re.IGNORECASE)
+
+# Better company name patterns
+_COMPANY_PATTERNS = PrefilteredPatterns([
+    r'(?:company|organization|firm|corporation):\s*([^\n]+?)(?:\n|$)',
+    r'(?:at|join|work with|we are)\s+([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+is|\s+seeks|\s+hiring|\s+offers|\n)',
+    r'^([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+is\s+(?:looking|seeking|hiring)|$)',
+    r'(?:about\s+)?([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+is\s+a\s+leading)',
+    r'(?:we\s+at\s+)([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+are)'
+], re.IGNORECASE | re.MULTILINE, _compile)
+
+# Phrases the company patterns pick up from skill and requirement sentences
+_COMPANY_FALSE_POSITIVES = ('data visualization', 'tools like', 'tableau', 'power bi', 'skills', 'experience', 'years')
+
+# Explicit location labels, checked before the city list
+_LOCATION_LABEL_PATTERNS = PrefilteredPatterns([
+    r'(?:location|based in|office in|work from):\s*([^\n]+?)(?:\n|$)'
+], re.IGNORECASE, _compile)
+
+# Known cities, matched against the alphabetic words of the text
+_WORD_RE = re.compile(r'[A-Za-z]+')
+_CITIES = frozenset({
+    'hyderabad', 'bangalore', 'bengaluru', 'pune', 'delhi', 'mumbai',
+    'chennai', 'kolkata', 'gurgaon', 'noida'
+})
+
+# Better location patterns
+_LOCATION_PATTERNS = PrefilteredPatterns([
+    r'(?:remote|hybrid|onsite|work from home)',
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\s*\([^)]{0,50}onsite[^)]{0,50}\)',
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\s*\([^)]{0,50}remote[^)]{0,50}\)'
+], re.IGNORECASE, _compile)
+
+# Section headers (required, preferred, responsibilities, benefits). Each header group
+# keeps its own matches from overlapping, as if it were scanned on its own
+_SECTION_HEADERS = (
+    ('required', r'(?:required|must have|mandatory|essential|core)\s+(?:skills|qualifications|requirements?)'),
+    ('required', r'candidate must have|candidates should have|you must have'),
+    ('required', r'(?:minimum|basic)\s+(?:requirements?|qualifications?)'),
+    ('preferred', r'preferred|good to have|nice to have|bonus|plus|advantage'),
+    ('preferred', r'(?:additional|extra|optional)\s+(?:skills|qualifications?)'),
+    ('preferred', r'would be great|ideal candidate'),
+    ('responsibilities', r'responsibilities|duties|what you will do|key responsibilities?'),
+    ('responsibilities', r'role and responsibilities?|job responsibilities?'),
+    ('benefits', r'benefits|perks|compensation|package'),
+    ('benefits', r'we offer|what we offer'),
+    # Benefit items stand on their own and have no body
+    ('benefits', r'(?:competitive|attractive)\s+(?:salary|package|compensation)')
+)
+_BENEFIT_ITEM_GROUP = f'h{len(_SECTION_HEADERS) - 1}'
+
+# Every header is a zero-width lookahead, so one pass reports a header at every position it
+# starts, including headers that fall inside another section's body. Lookaheads are not
+# supported by RE2, so this stays on re
+_SECTION_HEADER_RE = re.compile(
+    '|'.join(f'(?=(?P<h{index}>{pattern}))' for index, (_, pattern) in enumerate(_SECTION_HEADERS)),
+    re.IGNORECASE
+)
+
+# Section body: runs to the next full stop or line break, at most 400 characters, and may
+# contain other headers. The bound keeps a long text without full stops from being rescanned
+# to its end from every header
+_SECTION_BODY_RE = re.compile(r':?\s*([^.\n]{0,400})')
+
+_SECTION_NAMES = ('required', 'preferred', 'responsibilities', 'benefits')
+
+@functools.lru_cache(maxsize=8)
+def _scan_sections(text_lower: str) -> Dict[str, Tuple[str, ...]]:
+    """Collect the body of every section header in one pass over the text"""
+    bodies = [[] for _ in _SECTION_HEADERS]
+    # End of the last match of each header group; a group's next header must start after it
+    resume_at = [0] * len(_SECTION_HEADERS)
+    
+    for match in _SECTION_HEADER_RE.finditer(text_lower):
+        group = match.lastgroup
+        index = int(group[1:])
+        start = match.start()
+        if start < resume_at[index]:
+            continue
+        if group == _BENEFIT_ITEM_GROUP:
+            bodies[index].append(match.group(group))
+            resume_at[index] = match.end(group)
+            continue
+        body = _SECTION_BODY_RE.match(text_lower, match.end(group))
+        bodies[index].append(body.group(1))
+        resume_at[index] = body.end()
+    
+    # Sections list their bodies header group by header group, each in text order
+    sections = {name: [] for name in _SECTION_NAMES}
+    for (name, _), group_bodies in zip(_SECTION_HEADERS, bodies):
+        sections[name].extend(group_bodies)
+    return {name: tuple(group_bodies) for name, group_bodies in sections.items()}
+
+# Enhanced technical skills keywords
+_SKILL_KEYWORDS = (
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'go', 'rust', 'c++', 'c#', 'php', 'ruby', 'swift', 'kotlin', 'scala', 'r',
+    # Web Technologies
+    'react', 'angular', 'vue', 'node.js', 'nodejs', 'express', 'django', 'flask', 'fastapi', 'spring', 'laravel', 'rails',
+    # Databases
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'dynamodb', 'oracle',
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 'git', 'github', 'gitlab',
+    # Data Science & ML
+    'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
+    'seaborn', 'jupyter', 'spark', 'kafka',
+    # Frontend
+    'html', 'css', 'bootstrap', 'tailwind', 'sass', 'less', 'webpack', 'babel',
+    # Backend & APIs
+    'rest api', 'graphql', 'microservices', 'agile', 'scrum', 'devops', 'ci/cd',
+    # Mobile
+    'ios', 'android', 'flutter', 'react native', 'xamarin',
+    # System & Tools
+    'linux', 'unix', 'bash', 'shell', 'powershell', 'vim', 'emacs',
+    # Monitoring & Analytics
+    'prometheus', 'grafana', 'kibana', 'splunk', 'datadog',
+    # Additional skills
+    'tableau', 'power bi', 'excel', 'airflow', 'hadoop', 'hive', 'pig', 'sqoop'
+)
+
+# Keywords of two characters or fewer were always filtered out of results
+_SKILL_AUTOMATON = build_skill_automaton(_SKILL_KEYWORDS, min_length=3)
+
+# Degree tokens; the field of study is searched for in a bounded window after each token
+_DEGREE_PATTERNS = tuple(_compile(p, re.IGNORECASE) for p in [
+    r'(?:bachelor|master|phd|doctorate|diploma|certificate)',
+    r'(?:b\.?s\.?|m\.?s\.?|ph\.?d\.?|m\.?b\.?a\.?)',
+    r'(?:degree|graduation)'
+])
+_DEGREE_FIELD_RE = re.compile(r'(?:in|of|,).*?(?:computer science|engineering|technology|it|software)', re.IGNORECASE)
+_DEGREE_FIELD_WINDOW = 80
+
+# Every years-of-experience pattern needs one of these, so text without them skips the scans
+_YEARS_TRIGGERS = ('year', 'yr')
+
+# Experience-based qualification patterns
+_EXPERIENCE_QUALIFICATION_PATTERNS = tuple(_compile(p, re.IGNORECASE) for p in [
+    r'(?:years? of experience|experience level):?\s*(\d+[\+\-\s]*(?:years?|yrs?))',
+    r'(?:minimum|at least)\s+(\d+)\s+(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)'
+])
+
+# Experience level patterns
+_LEVEL_PATTERNS = tuple(_compile(p) for p in [
+    r'(?:entry level|junior|fresher|0-2\s*years?)',
+    r'(?:mid level|intermediate|2-5\s*years?)',
+    r'(?:senior|lead|5-8\s*years?)',
+    r'(?:principal|architect|8\+\s*years?)'
+])
+
+# Years of experience patterns; match.lastgroup identifies the alternative that matched
+_YEARS_RE = _compile('|'.join([
+    r'(?P<range_lo>\d+)\s*[-+]\s*(?P<range_hi>\d+)\s*(?:years?|yrs?)',
+    r'(?:minimum|at least)\s+(?P<minimum>\d+)\s+(?:years?|yrs?)',
+    r'(?P<plus>\d+)\+\s*(?:years?|yrs?)',
+    r'(?P<stated>\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)'
+]))
+
+# A range beats an explicit minimum, which beats "N+ years", which beats "N years of experience"
+_YEARS_PRIORITY = {'range_hi': 0, 'minimum': 1, 'plus': 2, 'stated': 3}
+
+# Number of parsed job descriptions kept per parser instance
+_PARSE_CACHE_SIZE = 128
+
 class JobDescriptionParser:
     def __init__(self):
-        """Initialize the job description parser with spaCy model"""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logger.warning("spaCy model not found. Please install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        """Initialize the job description parser with an empty parse cache"""
+        self._cache = DigestCache(_PARSE_CACHE_SIZE)
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize job description text"""
-        # Remove extra whitespace and normalize line breaks
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n+', '\n', text)
-        
-        # Remove common job posting headers/footers
-        headers_to_remove = [
-            r'job description',
-            r'job posting',
-            r'career opportunity',
-            r'we are hiring',
-            r'join our team'
-        ]
+        # Collapse whitespace only when there is something to collapse (see ResumeParser.clean_text)
+        if '  ' in text or not text.isprintable():
+            text = ' '.join(text.split())
         
-        for header in headers_to_remove:
-            text = re.sub(header, '', text, flags=re.IGNORECASE)
-        
-        return text.strip()
+        # Drop common headers/footers; sub returns the input itself when nothing matches
+        return _HEADERS_RE.sub('', text).strip()
     
-    def extract_job_title(self, text: str) -> str:
+    def extract_job_title(self, text: str, first_lines: Optional[List[str]] = None) -> str:
         """Extract job title from job description"""
-        # Enhanced patterns for job titles
-        title_patterns = [
-            r'(?:position|role|title|job|opening):\s*([^\n]+?)(?:\n|$)',
-            r'(?:we are looking for|seeking|hiring|recruiting)\s+(?:a|an)?\s*([^\n]+?)(?:\s+to|$|\n)',
-            r'^([A-Z][^.\n]{5,50}?)(?:\s+position|\s+role|\s+job|\n|$)',
-            r'(?:software|data|web|mobile|devops|cloud|ai|ml|backend|frontend|full.?stack)\s+(?:engineer|developer|analyst|scientist|architect|consultant|specialist)',
-            r'(?:senior|junior|lead|principal|staff|associate)\s+(?:software|data|web|mobile|devops|cloud|ai|ml|backend|frontend|full.?stack)\s+(?:engineer|developer|analyst|scientist|architect|consultant|specialist)',
-            r'(?:data\s+)?(?:engineer|developer|analyst|scientist|architect|consultant|specialist|intern)',
-            r'(?:python|java|javascript|react|angular|vue|node)\s+(?:developer|engineer)',
-            r'(?:machine learning|deep learning|ai|ml)\s+(?:engineer|developer|scientist|specialist)'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in title_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TITLE_PATTERNS.candidates(text):
+            matches = pattern.findall(text)
             if matches:
                 title = matches[0].strip()
                 # Clean up the title
-                title = re.sub(r'\s+', ' ', title)  # Remove extra spaces
+                title = ' '.join(title.split())  # Remove extra spaces
                 if len(title) > 3 and len(title) < 100:  # Reasonable length
                     return title
         
         # Fallback: look for common job titles in the first few lines
-        lines = text.split('\n')[:10]  # Check more lines
-        for line in lines:
+        if first_lines is None:
+            first_lines = self._first_lines(text)
+        for line in first_lines:
             line = line.strip()
-            if any(keyword in line.lower() for keyword in 
-                  ['engineer', 'developer', 'analyst', 'scientist', 'architect', 'consultant', 'manager', 'intern']):
+            if _JOB_KEYWORD_RE.search(line):
                 # Clean up the line
-                line = re.sub(r'\s+', ' ', line)
+                line = ' '.join(line.split())
                 if len(line) > 3 and len(line) < 100:
                     return line
         
         return "Software Engineer"  # Default fallback
     
+    def _first_lines(self, text: str, count: int = 10) -> List[str]:
+        """Return the first lines of the text without splitting the rest of it"""
+        lines = []
+        start = 0
+        while len(lines) < count:
+            end = text.find('\n', start)
+            if end == -1:
+                lines.append(text[start:])
+                break
+            lines.append(text[start:end])
+            start = end + 1
+        return lines
+    
     def extract_company_info(self, text: str) -> Dict[str, str]:
         """Extract company information"""
         company_info = {
@@ -82,155 +322,110 @@ class JobDescriptionParser:
             "industry": ""
         }
         
-        # Better company name patterns
-        company_patterns = [
-            r'(?:company|organization|firm|corporation):\s*([^\n]+?)(?:\n|$)',
-            r'(?:at|join|work with|we are)\s+([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+is|\s+seeks|\s+hiring|\s+offers|\n)',
-            r'^([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+is\s+(?:looking|seeking|hiring)|$)',
-            r'(?:about\s+)?([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+is\s+a\s+leading)',
-            r'(?:we\s+at\s+)([A-Z][a-zA-Z\s&]{2,50}?)(?:\s+are)'
-        ]
-        
-        for pattern in company_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _COMPANY_PATTERNS.candidates(text):
+            matches = pattern.findall(text)
             if matches:
                 company_name = matches[0].strip()
                 # Filter out common false positives
-                if not any(word in company_name.lower() for word in 
-                          ['data visualization', 'tools like', 'tableau', 'power bi', 'skills', 'experience', 'years']):
+                if not any(word in company_name.lower() for word in _COMPANY_FALSE_POSITIVES):
                     company_info["name"] = company_name
                     break
         
-        # Better location patterns
-        location_patterns = [
-            r'(?:location|based in|office in|work from):\s*([^\n]+?)(?:\n|$)',
-            r'(?:hyderabad|bangalore|pune|delhi|mumbai|chennai|kolkata|gurgaon|noida|bengaluru)(?:\s*\([^)]+\))?',
-            r'(?:remote|hybrid|onsite|work from home)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\([^)]*onsite[^)]*\)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\([^)]*remote[^)]*\)'
-        ]
+        location = (
+            self._find_location(_LOCATION_LABEL_PATTERNS, text)
+            or self._find_city(text)
+            or self._find_location(_LOCATION_PATTERNS, text)
+        )
+        if location:
+            company_info["location"] = location
         
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        return company_info
+    
+    def _find_location(self, patterns: PrefilteredPatterns, text: str) -> str:
+        """Return the first usable location matched by the given patterns"""
+        for pattern in patterns.candidates(text):
+            matches = pattern.findall(text)
             if matches:
                 location = matches[0].strip()
                 # Clean up location text
-                location = re.sub(r'\([^)]*\)', '', location).strip()
+                location = _PARENTHESES_RE.sub('', location).strip()
                 if location and len(location) < 50:  # Avoid very long location strings
-                    company_info["location"] = location
-                    break
-        
-        return company_info
+                    return location
+        return ""
+    
+    def _find_city(self, text: str) -> str:
+        """Return the first known city mentioned in the text"""
+        for word in _WORD_RE.finditer(text):
+            city = word.group(0)
+            if city.lower() in _CITIES:
+                return city
+        return ""
     
-    def extract_required_skills(self, text: str) -> List[str]:
+    def extract_required_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract must-have/required skills"""
         required_skills = []
         
-        # Look for required skills sections
-        required_sections = [
-            r'(?:required|must have|mandatory|essential|core)\s+(?:skills|qualifications|requirements?):?\s*([^.]*)',
-            r'(?:candidate must have|candidates should have|you must have):?\s*([^.]*)',
-            r'(?:minimum|basic)\s+(?:requirements?|qualifications?):?\s*([^.]*)'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in required_sections:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                # Extract skills from the matched text
-                skills = self._extract_skills_from_text(match)
-                required_skills.extend(skills)
+        if text_lower is None:
+            text_lower = text.lower()
+        for section in _scan_sections(text_lower)['required']:
+            # Extract skills from the section text
+            skills = self._extract_skills_from_text(section)
+            required_skills.extend(skills)
         
         # Also look for technical skills mentioned throughout the document
-        all_skills = self._extract_skills_from_text(text)
+        all_skills = self._extract_skills_from_text(text_lower)
         required_skills.extend(all_skills)
         
-        return list(set(skill.lower() for skill in required_skills))
+        return list(dict.fromkeys(required_skills))
     
-    def extract_preferred_skills(self, text: str) -> List[str]:
+    def extract_preferred_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract good-to-have/preferred skills"""
         preferred_skills = []
         
-        # Look for preferred skills sections
-        preferred_sections = [
-            r'(?:preferred|good to have|nice to have|bonus|plus|advantage):?\s*([^.]*)',
-            r'(?:additional|extra|optional)\s+(?:skills|qualifications?):?\s*([^.]*)',
-            r'(?:would be great|ideal candidate):?\s*([^.]*)'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in preferred_sections:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                skills = self._extract_skills_from_text(match)
-                preferred_skills.extend(skills)
+        if text_lower is None:
+            text_lower = text.lower()
+        for section in _scan_sections(text_lower)['preferred']:
+            skills = self._extract_skills_from_text(section)
+            preferred_skills.extend(skills)
         
-        return list(set(skill.lower() for skill in preferred_skills))
+        return list(dict.fromkeys(preferred_skills))
     
-    def _extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract technical skills from a given text"""
-        skills = []
-        
-        # Enhanced technical skills patterns
-        skill_patterns = [
-            # Programming Languages
-            r'\b(python|java|javascript|typescript|go|rust|c\+\+|c#|php|ruby|swift|kotlin|scala|r)\b',
-            # Web Technologies
-            r'\b(react|angular|vue|node\.?js|express|django|flask|fastapi|spring|laravel|rails)\b',
-            # Databases
-            r'\b(sql|mysql|postgresql|mongodb|redis|elasticsearch|cassandra|dynamodb|oracle)\b',
-            # Cloud & DevOps
-            r'\b(aws|azure|gcp|docker|kubernetes|jenkins|terraform|ansible|git|github|gitlab)\b',
-            # Data Science & ML
-            r'\b(machine learning|deep learning|tensorflow|pytorch|scikit-learn|pandas|numpy|matplotlib|seaborn|jupyter|spark|kafka)\b',
-            # Frontend
-            r'\b(html|css|bootstrap|tailwind|sass|less|webpack|babel)\b',
-            # Backend & APIs
-            r'\b(rest api|graphql|microservices|agile|scrum|devops|ci/cd)\b',
-            # Mobile
-            r'\b(ios|android|flutter|react native|xamarin)\b',
-            # System & Tools
-            r'\b(linux|unix|bash|shell|powershell|vim|emacs)\b',
-            # Monitoring & Analytics
-            r'\b(prometheus|grafana|kibana|splunk|datadog)\b',
-            # Additional skills
-            r'\b(tableau|power bi|excel|airflow|hadoop|hive|pig|sqoop)\b'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            skills.extend(matches)
-        
-        # Remove duplicates and clean up
-        unique_skills = list(set(skill.lower() for skill in skills))
-        
-        # Filter out very short or common words
-        filtered_skills = [skill for skill in unique_skills if len(skill) > 2 and skill not in ['api', 'ci', 'cd']]
-        
-        return filtered_skills
+    def _extract_skills_from_text(self, text_lower: str) -> List[str]:
+        """Extract technical skills from already lowercased text"""
+        return find_skills(_SKILL_AUTOMATON, text_lower)
     
-    def extract_qualifications(self, text: str) -> List[str]:
+    def extract_qualifications(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract educational qualifications"""
         qualifications = []
         
-        # Education patterns
-        education_patterns = [
-            r'(?:bachelor|master|phd|doctorate|diploma|certificate).*?(?:in|of|,).*?(?:computer science|engineering|technology|it|software)',
-            r'(?:b\.?s\.?|m\.?s\.?|ph\.?d\.?|m\.?b\.?a\.?).*?(?:in|of|,).*?(?:computer science|engineering|technology|it|software)',
-            r'(?:degree|graduation).*?(?:in|of|,).*?(?:computer science|engineering|technology|it|software)',
-            r'(?:years? of experience|experience level):?\s*(\d+[\+\-\s]*(?:years?|yrs?))',
-            r'(?:minimum|at least)\s+(\d+)\s+(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)'
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
+        for pattern in _DEGREE_PATTERNS:
+            qualifications.extend(self._find_degree_mentions(pattern, text_lower))
         
-        text_lower = text.lower()
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            qualifications.extend(matches)
+        if any(trigger in text_lower for trigger in _YEARS_TRIGGERS):
+            for pattern in _EXPERIENCE_QUALIFICATION_PATTERNS:
+                matches = pattern.findall(text_lower)
+                qualifications.extend(matches)
         
         return qualifications
     
-    def extract_experience_requirements(self, text: str) -> Dict[str, Any]:
+    def _find_degree_mentions(self, degree_pattern: re.Pattern, text: str) -> List[str]:
+        """Find degree mentions followed by a field of study within a bounded window"""
+        mentions = []
+        search_from = 0
+        
+        for match in degree_pattern.finditer(text):
+            if match.start() < search_from:
+                continue
+            field = _DEGREE_FIELD_RE.search(text, match.end(), match.end() + _DEGREE_FIELD_WINDOW)
+            if field:
+                mentions.append(text[match.start():field.end()])
+                search_from = field.end()
+        
+        return mentions
+    
+    def extract_experience_requirements(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract experience requirements"""
         experience_req = {
             "min_years": 0,
@@ -239,105 +434,81 @@ class JobDescriptionParser:
             "description": ""
         }
         
-        # Experience level patterns
-        level_patterns = [
-            r'(?:entry level|junior|fresher|0-2\s*years?)',
-            r'(?:mid level|intermediate|2-5\s*years?)',
-            r'(?:senior|lead|5-8\s*years?)',
-            r'(?:principal|architect|8\+\s*years?)'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in level_patterns:
-            if re.search(pattern, text_lower):
-                experience_req["level"] = re.search(pattern, text_lower).group(0)
+        if text_lower is None:
+            text_lower = text.lower()
+        for pattern in _LEVEL_PATTERNS:
+            if (level_match := pattern.search(text_lower)):
+                experience_req["level"] = level_match.group(0)
                 break
         
-        # Years of experience patterns
-        years_patterns = [
-            r'(\d+)\s*[-+]\s*(\d+)\s*(?:years?|yrs?)',
-            r'(?:minimum|at least)\s+(\d+)\s+(?:years?|yrs?)',
-            r'(\d+)\+\s*(?:years?|yrs?)',
-            r'(\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)'
-        ]
+        if not any(trigger in text_lower for trigger in _YEARS_TRIGGERS):
+            return experience_req
         
-        for pattern in years_patterns:
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    if len(matches[0]) == 2:
-                        experience_req["min_years"] = int(matches[0][0])
-                        experience_req["max_years"] = int(matches[0][1])
-                    else:
-                        experience_req["min_years"] = int(matches[0][0])
-                else:
-                    experience_req["min_years"] = int(matches[0])
-                break
+        match = min(
+            _YEARS_RE.finditer(text_lower),
+            key=lambda m: _YEARS_PRIORITY[m.lastgroup],
+            default=None
+        )
+        if match:
+            lo, hi = match['range_lo'] or match[match.lastgroup], match['range_hi']
+            experience_req["min_years"] = int(lo)
+            if hi:
+                experience_req["max_years"] = int(hi)
         
         return experience_req
     
-    def extract_responsibilities(self, text: str) -> List[str]:
+    def extract_responsibilities(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract job responsibilities"""
         responsibilities = []
         
-        # Look for responsibilities sections
-        resp_sections = [
-            r'(?:responsibilities|duties|what you will do|key responsibilities?):?\s*([^.]*)',
-            r'(?:role and responsibilities?|job responsibilities?):?\s*([^.]*)'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in resp_sections:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                # Split by bullet points or line breaks
-                points = re.split(r'[•\-\*\n]', match)
-                for point in points:
-                    point = point.strip()
-                    if len(point) > 10:
-                        responsibilities.append(point)
+        if text_lower is None:
+            text_lower = text.lower()
+        for section in _scan_sections(text_lower)['responsibilities']:
+            # Split by bullet points or line breaks
+            points = section.translate(_BULLET_TRANS).split('\n')
+            for point in points:
+                point = point.strip()
+                if len(point) > 10:
+                    responsibilities.append(point)
         
         return responsibilities
     
-    def extract_benefits(self, text: str) -> List[str]:
+    def extract_benefits(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract benefits and perks"""
         benefits = []
         
-        # Benefits patterns
-        benefit_patterns = [
-            r'(?:benefits|perks|compensation|package):?\s*([^.]*)',
-            r'(?:we offer|what we offer):?\s*([^.]*)',
-            r'(?:competitive|attractive)\s+(?:salary|package|compensation)'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in benefit_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                # Split by bullet points or line breaks
-                points = re.split(r'[•\-\*\n]', match)
-                for point in points:
-                    point = point.strip()
-                    if len(point) > 5:
-                        benefits.append(point)
+        if text_lower is None:
+            text_lower = text.lower()
+        for section in _scan_sections(text_lower)['benefits']:
+            # Split by bullet points or line breaks
+            points = section.translate(_BULLET_TRANS).split('\n')
+            for point in points:
+                point = point.strip()
+                if len(point) > 5:
+                    benefits.append(point)
         
         return benefits
     
     def parse_job_description(self, text: str) -> Dict[str, Any]:
         """Main method to parse job description and extract all information"""
+        return self._cache.get_or_compute(DigestCache.key(text), lambda: self._parse_job_description(text))
+    
+    def _parse_job_description(self, text: str) -> Dict[str, Any]:
+        """Parse job description text without consulting the cache"""
         try:
             # Clean text
             cleaned_text = self.clean_text(text)
+            cleaned_lower = cleaned_text.lower()
             
             # Extract various components
-            job_title = self.extract_job_title(cleaned_text)
+            job_title = self.extract_job_title(cleaned_text, self._first_lines(cleaned_text))
             company_info = self.extract_company_info(cleaned_text)
-            required_skills = self.extract_required_skills(cleaned_text)
-            preferred_skills = self.extract_preferred_skills(cleaned_text)
-            qualifications = self.extract_qualifications(cleaned_text)
-            experience_req = self.extract_experience_requirements(cleaned_text)
-            responsibilities = self.extract_responsibilities(cleaned_text)
-            benefits = self.extract_benefits(cleaned_text)
+            required_skills = self.extract_required_skills(cleaned_text, cleaned_lower)
+            preferred_skills = self.extract_preferred_skills(cleaned_text, cleaned_lower)
+            qualifications = self.extract_qualifications(cleaned_text, cleaned_lower)
+            experience_req = self.extract_experience_requirements(cleaned_text, cleaned_lower)
+            responsibilities = self.extract_responsibilities(cleaned_text, cleaned_lower)
+            benefits = self.extract_benefits(cleaned_text, cleaned_lower)
             
             return {
                 "raw_text": text,
@@ -346,12 +517,14 @@ class JobDescriptionParser:
                 "company_info": company_info,
                 "required_skills": required_skills,
                 "preferred_skills": preferred_skills,
+                "required_skills_norm": normalize_skills(required_skills),
+                "preferred_skills_norm": normalize_skills(preferred_skills),
                 "qualifications": qualifications,
                 "experience_requirements": experience_req,
                 "responsibilities": responsibilities,
                 "benefits": benefits
             }
-            
+        
         except Exception as e:
             logger.error(f"Error parsing job description: {e}")
             return {
@@ -361,9 +534,23 @@ class JobDescriptionParser:
                 "company_info": {},
                 "required_skills": [],
                 "preferred_skills": [],
+                "required_skills_norm": [],
+                "preferred_skills_norm": [],
                 "qualifications": [],
                 "experience_requirements": {},
                 "responsibilities": [],
                 "benefits": [],
                 "error": str(e)
             }
+    
+    def parse_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Parse several job descriptions; repeated texts are served from the cache"""
+        return [self.parse_job_description(text) for text in texts]
+    
+    async def parse_job_description_async(self, text: str) -> Dict[str, Any]:
+        """Parse a job description in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(self.parse_job_description, text)
+    
+    async def parse_many_async(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Parse several job descriptions in a worker thread"""
+        return await asyncio.to_thread(self.parse_many, texts)
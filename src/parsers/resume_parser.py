@@ -3,73 +3,106 @@ import pdfplumber
 import docx2txt
 from docx import Document
 import re
+import os
+import mmap
 import json
+import time
 from typing import Dict, List, Optional, Any
-import spacy
-from spacy.matcher import Matcher
+from concurrent.futures import ProcessPoolExecutor
 import logging
+from ._prefilter import PrefilteredPatterns
+from ._skills import build_skill_automaton, find_skills
+
+try:
+    from ..utils.skills import normalize_skills
+except ImportError:
+    # Imported as a top-level package with src/ on sys.path (tests)
+    from utils.skills import normalize_skills
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by all parser instances
+
+# Contact patterns, matched on the raw text so tokenization cannot split them
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RE = re.compile(r'(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')
+
+# Common resume headers/footers
+_HEADERS_RE = re.compile('|'.join([
+    r'page \d+ of \d+',
+    r'confidential',
+    r'private',
+    r'resume',
+    r'curriculum vitae',
+    r'cv'
+]), re.IGNORECASE)
+
+# Common technical skills, matched in a single pass
+_SKILL_TERMS = (
+    'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js', 'nodejs', 'express', 'django', 'flask', 'fastapi',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'docker', 'kubernetes',
+    'aws', 'azure', 'gcp', 'git', 'github', 'gitlab',
+    'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
+    'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter',
+    'html', 'css', 'bootstrap', 'tailwind', 'sass', 'less', 'typescript',
+    'rest api', 'graphql', 'microservices', 'agile', 'scrum', 'devops'
+)
+_SKILL_AUTOMATON = build_skill_automaton(_SKILL_TERMS)
+
+# Words that rule a line out as the candidate's name, matched anywhere in the line
+_NAME_EXCLUDED_RE = re.compile(r'resume|cv|curriculum|vitae|email|phone|address', re.IGNORECASE)
+
+# Lines that open the work history and project sections
+_EXPERIENCE_KEYWORDS = ('experience', 'work', 'employment')
+_PROJECT_KEYWORDS = ('project', 'portfolio', 'github', 'repository')
+
+# Education patterns
+_EDUCATION_PATTERNS = PrefilteredPatterns([
+    r'(bachelor|master|phd|doctorate|diploma|certificate).*?(in|of|,).*?(\d{4}|\d{4}-\d{4})',
+    r'(b\.?s\.?|m\.?s\.?|ph\.?d\.?|m\.?b\.?a\.?).*?(in|of|,).*?(\d{4}|\d{4}-\d{4})',
+    r'(university|college|institute).*?(\d{4}|\d{4}-\d{4})'
+], re.IGNORECASE)
+# Every education pattern ends in a year, so text without one is skipped with a linear scan
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Certification patterns
+_CERT_PATTERNS = PrefilteredPatterns([
+    r'\b(aws|azure|gcp|google|microsoft|oracle|cisco|comptia).*?(certified|certification|certificate)\b',
+    r'\b(certified|certification|certificate).*?(aws|azure|gcp|google|microsoft|oracle|cisco|comptia)\b',
+    r'\b(pmp|scrum|agile|itil|six sigma)\b'
+], re.IGNORECASE)
+# Substrings at least one of which every certification match contains
+_CERT_TRIGGERS = ('certif', 'pmp', 'scrum', 'agile', 'itil', 'six sigma')
+
+# Some PDFs extract hundreds of KB of junk; only the head of a resume is parsed so the
+# extraction passes never see more than this much text. This caps input length only, not
+# the worst-case backtracking of any individual pattern
+_MAX_TEXT_CHARS = 100_000
+# Contact details sit at the top of a resume
+_CONTACT_HEAD_CHARS = 2000
+
 class ResumeParser:
-    def __init__(self):
-        """Initialize the resume parser with spaCy model"""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logger.warning("spaCy model not found. Please install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
-        
-        # Initialize matcher for pattern recognition
-        if self.nlp:
-            self.matcher = Matcher(self.nlp.vocab)
-            self._setup_patterns()
-    
-    def _setup_patterns(self):
-        """Set up spaCy patterns for entity recognition"""
-        # Email pattern
-        email_pattern = [{"TEXT": {"REGEX": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"}}]
-        self.matcher.add("EMAIL", [email_pattern])
-        
-        # Phone pattern
-        phone_pattern = [{"TEXT": {"REGEX": r"(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}"}}]
-        self.matcher.add("PHONE", [phone_pattern])
-        
-        # Skills pattern (common technical skills)
-        skills_keywords = [
-            "python", "java", "javascript", "react", "angular", "vue", "node.js", "express",
-            "django", "flask", "fastapi", "spring", "hibernate", "sql", "mysql", "postgresql",
-            "mongodb", "redis", "docker", "kubernetes", "aws", "azure", "gcp", "git",
-            "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn",
-            "pandas", "numpy", "matplotlib", "seaborn", "jupyter", "data analysis",
-            "web development", "mobile development", "ios", "android", "swift", "kotlin",
-            "html", "css", "bootstrap", "tailwind", "sass", "less", "typescript",
-            "rest api", "graphql", "microservices", "agile", "scrum", "devops"
-        ]
-        
-        for skill in skills_keywords:
-            skill_pattern = [{"LOWER": skill}]
-            self.matcher.add(f"SKILL_{skill.upper()}", [skill_pattern])
-    
     def extract_text_from_pdf(self, file_path: str) -> str:
         """Extract text from PDF using PyMuPDF"""
         try:
-            doc = fitz.open(file_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            return text
+            # Map the file rather than having MuPDF buffer it, so the OS pages it in on demand
+            # and concurrent workers reading the same file share the page cache
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # The view must be released before the map can close
+                with memoryview(mapped) as view:
+                    doc = fitz.open(stream=view, filetype="pdf")
+                    try:
+                        return "".join(page.get_text() for page in doc)
+                    finally:
+                        doc.close()
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
             # Fallback to pdfplumber
             try:
                 with pdfplumber.open(file_path) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        text += page.extract_text() or ""
+                    text = "".join(page.extract_text() or "" for page in pdf.pages)
                 return text
             except Exception as e2:
                 logger.error(f"Error with pdfplumber fallback: {e2}")
@@ -80,10 +113,7 @@ class ResumeParser:
         try:
             # Try with python-docx first
             doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
         except Exception as e:
             logger.error(f"Error with python-docx: {e}")
             # Fallback to docx2txt
@@ -99,7 +129,7 @@ class ResumeParser:
         
         if file_extension == 'pdf':
             return self.extract_text_from_pdf(file_path)
-        elif file_extension in ['docx', 'doc']:
+        elif file_extension in ('docx', 'doc'):
             return self.extract_text_from_docx(file_path)
         else:
             logger.error(f"Unsupported file format: {file_extension}")
@@ -107,24 +137,14 @@ class ResumeParser:
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
-        # Remove extra whitespace and normalize line breaks
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n+', '\n', text)
-        
-        # Remove common resume headers/footers
-        headers_to_remove = [
-            r'page \d+ of \d+',
-            r'confidential',
-            r'private',
-            r'resume',
-            r'curriculum vitae',
-            r'cv'
-        ]
-        
-        for header in headers_to_remove:
-            text = re.sub(header, '', text, flags=re.IGNORECASE)
+        # Collapse all whitespace (line breaks included). Every whitespace character other
+        # than a plain space is non-printable, so text that is printable and has no double
+        # spaces is already collapsed and the pass is skipped
+        if '  ' in text or not text.isprintable():
+            text = ' '.join(text.split())
         
-        return text.strip()
+        # Drop common headers/footers; sub returns the input itself when nothing matches
+        return _HEADERS_RE.sub('', text).strip()
     
     def extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information from resume text"""
@@ -134,18 +154,10 @@ class ResumeParser:
             "name": ""
         }
         
-        if not self.nlp:
-            return contact_info
-        
-        doc = self.nlp(text)
-        matches = self.matcher(doc)
-        
-        for match_id, start, end in matches:
-            label = self.nlp.vocab.strings[match_id]
-            if label == "EMAIL":
-                contact_info["email"] = doc[start:end].text
-            elif label == "PHONE":
-                contact_info["phone"] = doc[start:end].text
+        if (email := _EMAIL_RE.search(text)):
+            contact_info["email"] = email.group(0)
+        if (phone := _PHONE_RE.search(text)):
+            contact_info["phone"] = phone.group(0)
         
         # Extract name (first line that looks like a name)
         lines = text.split('\n')
@@ -153,49 +165,28 @@ class ResumeParser:
             line = line.strip()
             if len(line) > 2 and len(line) < 50:
                 # Simple heuristic: if line doesn't contain common resume keywords
-                if not any(keyword in line.lower() for keyword in 
-                          ['resume', 'cv', 'curriculum', 'vitae', 'email', 'phone', 'address']):
+                if not _NAME_EXCLUDED_RE.search(line):
                     contact_info["name"] = line
                     break
         
         return contact_info
     
-    def extract_skills(self, text: str) -> List[str]:
+    def extract_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract skills from resume text"""
-        skills = []
-        
-        # Common technical skills patterns
-        skill_patterns = [
-            r'\b(python|java|javascript|react|angular|vue|node\.?js|express|django|flask|fastapi)\b',
-            r'\b(sql|mysql|postgresql|mongodb|redis|docker|kubernetes)\b',
-            r'\b(aws|azure|gcp|git|github|gitlab)\b',
-            r'\b(machine learning|deep learning|tensorflow|pytorch|scikit-learn)\b',
-            r'\b(pandas|numpy|matplotlib|seaborn|jupyter)\b',
-            r'\b(html|css|bootstrap|tailwind|sass|less|typescript)\b',
-            r'\b(rest api|graphql|microservices|agile|scrum|devops)\b'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            skills.extend(matches)
-        
-        # Remove duplicates and return
-        return list(set(skill.lower() for skill in skills))
+        if text_lower is None:
+            text_lower = text.lower()
+        # Matches come from the lowercased text already and the scan drops duplicates
+        return find_skills(_SKILL_AUTOMATON, text_lower)
     
     def extract_education(self, text: str) -> List[Dict[str, str]]:
         """Extract education information"""
         education = []
         
-        # Education patterns
-        education_patterns = [
-            r'(bachelor|master|phd|doctorate|diploma|certificate).*?(in|of|,).*?(\d{4}|\d{4}-\d{4})',
-            r'(b\.?s\.?|m\.?s\.?|ph\.?d\.?|m\.?b\.?a\.?).*?(in|of|,).*?(\d{4}|\d{4}-\d{4})',
-            r'(university|college|institute).*?(\d{4}|\d{4}-\d{4})'
-        ]
+        if not _YEAR_RE.search(text):
+            return education
         
-        for pattern in education_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _EDUCATION_PATTERNS.candidates(text):
+            matches = pattern.finditer(text)
             for match in matches:
                 education.append({
                     "degree": match.group(0).strip(),
@@ -205,22 +196,16 @@ class ResumeParser:
         
         return education
     
-    def extract_experience(self, text: str) -> List[Dict[str, str]]:
+    def extract_experience(self, text: str, text_lower: Optional[str] = None) -> List[Dict[str, str]]:
         """Extract work experience information"""
         experience = []
         
-        # Experience patterns
-        exp_patterns = [
-            r'(experience|work|employment|career)',
-            r'(intern|internship|trainee)',
-            r'(developer|engineer|analyst|manager|consultant)'
-        ]
-        
+        if text_lower is None:
+            text_lower = text.lower()
         # Simple extraction - look for job titles and companies
         lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in ['experience', 'work', 'employment']):
+        for i, line_lower in enumerate(text_lower.split('\n')):
+            if any(keyword in line_lower for keyword in _EXPERIENCE_KEYWORDS):
                 # Look for job titles in following lines
                 for j in range(i+1, min(i+10, len(lines))):
                     next_line = lines[j].strip()
@@ -235,17 +220,15 @@ class ResumeParser:
         
         return experience
     
-    def extract_projects(self, text: str) -> List[Dict[str, str]]:
+    def extract_projects(self, text: str, text_lower: Optional[str] = None) -> List[Dict[str, str]]:
         """Extract project information"""
         projects = []
         
-        # Project patterns
-        project_keywords = ['project', 'portfolio', 'github', 'repository']
-        
+        if text_lower is None:
+            text_lower = text.lower()
         lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in project_keywords):
+        for i, line_lower in enumerate(text_lower.split('\n')):
+            if any(keyword in line_lower for keyword in _PROJECT_KEYWORDS):
                 # Look for project descriptions in following lines
                 for j in range(i+1, min(i+5, len(lines))):
                     next_line = lines[j].strip()
@@ -260,22 +243,20 @@ class ResumeParser:
         
         return projects
     
-    def extract_certifications(self, text: str) -> List[str]:
+    def extract_certifications(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract certifications"""
-        certifications = []
+        certifications = set()
         
-        # Certification patterns
-        cert_patterns = [
-            r'\b(aws|azure|gcp|google|microsoft|oracle|cisco|comptia).*?(certified|certification|certificate)\b',
-            r'\b(certified|certification|certificate).*?(aws|azure|gcp|google|microsoft|oracle|cisco|comptia)\b',
-            r'\b(pmp|scrum|agile|itil|six sigma)\b'
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
+        if not any(trigger in text_lower for trigger in _CERT_TRIGGERS):
+            return []
         
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            certifications.extend(matches)
+        for pattern in _CERT_PATTERNS.candidates(text):
+            # Take the whole match; findall would return group tuples for the multi-group patterns
+            certifications.update(match.group(0).lower() for match in pattern.finditer(text))
         
-        return list(set(cert.lower() for cert in certifications))
+        return list(certifications)
     
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
         """Main method to parse resume and extract all information"""
@@ -287,25 +268,29 @@ class ResumeParser:
             
             # Clean text
             cleaned_text = self.clean_text(raw_text)
+            if len(cleaned_text) > _MAX_TEXT_CHARS:
+                cleaned_text = cleaned_text[:_MAX_TEXT_CHARS]
+            cleaned_lower = cleaned_text.lower()
             
             # Extract various components
-            contact_info = self.extract_contact_info(cleaned_text)
-            skills = self.extract_skills(cleaned_text)
+            contact_info = self.extract_contact_info(cleaned_text[:_CONTACT_HEAD_CHARS])
+            skills = self.extract_skills(cleaned_text, cleaned_lower)
             education = self.extract_education(cleaned_text)
-            experience = self.extract_experience(cleaned_text)
-            projects = self.extract_projects(cleaned_text)
-            certifications = self.extract_certifications(cleaned_text)
+            experience = self.extract_experience(cleaned_text, cleaned_lower)
+            projects = self.extract_projects(cleaned_text, cleaned_lower)
+            certifications = self.extract_certifications(cleaned_text, cleaned_lower)
             
             return {
                 "raw_text": raw_text,
                 "cleaned_text": cleaned_text,
                 "contact_info": contact_info,
                 "skills": skills,
+                "skills_norm": normalize_skills(skills),
                 "education": education,
                 "experience": experience,
                 "projects": projects,
                 "certifications": certifications,
-                "filename": file_path.split('/')[-1] if '/' in file_path else file_path.split('\\')[-1]
+                "filename": os.path.basename(file_path)
             }
             
         except Exception as e:
@@ -315,6 +300,7 @@ class ResumeParser:
                 "cleaned_text": "",
                 "contact_info": {},
                 "skills": [],
+                "skills_norm": [],
                 "education": [],
                 "experience": [],
                 "projects": [],
@@ -322,3 +308,21 @@ class ResumeParser:
                 "filename": "",
                 "error": str(e)
             }
+    
+    def parse_resumes(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Parse several resumes in worker processes; results keep the order of file_paths"""
+        # PyMuPDF is not thread-safe, so files are spread over processes rather than threads;
+        # there is no point starting more processes than there are files
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(file_paths)))
+        start = time.perf_counter()
+        if workers == 1:
+            results = [self.parse_resume(file_path) for file_path in file_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_parse_resume_file, file_paths))
+        logger.info(f"Parsed {len(file_paths)} resumes in {time.perf_counter() - start:.2f}s with {workers} workers")
+        return results
+
+def _parse_resume_file(file_path: str) -> Dict[str, Any]:
+    """Parse one resume in a parse_resumes worker process"""
+    return ResumeParser().parse_resume(file_path)
@@ -1,10 +1,12 @@
-import os
+import math
 from typing import Dict, List, Any, Tuple
 import logging
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    from ..utils import config
+except ImportError:
+    # Imported as a top-level package with src/ on sys.path (tests)
+    from utils import config
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -13,13 +15,13 @@ logger = logging.getLogger(__name__)
 class ScoringEngine:
     def __init__(self):
         """Initialize the scoring engine with configurable weights"""
-        # Get weights from environment or use defaults
-        self.hard_match_weight = float(os.getenv("HARD_MATCH_WEIGHT", "0.4"))
-        self.semantic_match_weight = float(os.getenv("SEMANTIC_MATCH_WEIGHT", "0.6"))
+        # Get weights from the configuration (environment or defaults)
+        self.hard_match_weight = config.CONFIG.HARD_MATCH_WEIGHT
+        self.semantic_match_weight = config.CONFIG.SEMANTIC_MATCH_WEIGHT
         
         # Ensure weights sum to 1
         total_weight = self.hard_match_weight + self.semantic_match_weight
-        if total_weight != 1.0:
+        if not math.isclose(total_weight, 1.0, abs_tol=1e-9):
             self.hard_match_weight = self.hard_match_weight / total_weight
             self.semantic_match_weight = self.semantic_match_weight / total_weight
             logger.warning(f"Adjusted weights to sum to 1.0: hard={self.hard_match_weight}, semantic={self.semantic_match_weight}")
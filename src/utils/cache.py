@@ -0,0 +1,51 @@
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+class DigestCache:
+    """Thread-safe LRU of results keyed by a 16-byte BLAKE2b digest of their inputs
+    
+    Only the digest is kept, never the inputs, and callers always get their own copy of a
+    result so a cached entry is never mutated.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(*parts: str) -> bytes:
+        """Digest the given strings into a cache key"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            # surrogatepass: text from a bad PDF or clipboard decode may hold lone surrogates
+            encoded = part.encode('utf-8', 'surrogatepass')
+            # Length prefixes keep ("ab", "c") and ("a", "bc") apart
+            digest.update(len(encoded).to_bytes(8, 'little'))
+            digest.update(encoded)
+        return digest.digest()
+    
+    def get_or_compute(self, key: bytes, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return a copy of the result cached under key, computing it on a miss
+        
+        Results with an "error" entry are returned but not cached, so a failure is retried.
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return copy.deepcopy(cached)
+        
+        result = compute()
+        if "error" not in result:
+            with self._lock:
+                self._entries[key] = result
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return copy.deepcopy(result)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,53 +1,94 @@
 import os
+import math
+from dataclasses import dataclass
+from typing import ClassVar, FrozenSet, List, Mapping, Optional
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once for the whole application; values the platform has
+# already injected take precedence over .env
+load_dotenv(override=False)
 
+@dataclass(frozen=True)
 class Config:
-    """Configuration class for the application"""
+    """Configuration for the application, read from the environment once
+    
+    The fixed constants are class attributes. The values read from the environment only
+    exist on instances; read them from the module-level CONFIG (Config.DEBUG raises
+    AttributeError).
+    """
     
     # API Configuration
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-    DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gemini-pro")
-    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+    GOOGLE_API_KEY: Optional[str]
+    DEFAULT_MODEL: str
+    EMBEDDING_MODEL: str
     
     # Database Configuration
-    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./resume_evaluation.db")
+    DATABASE_URL: str
     
     # Application Configuration
-    DEBUG = os.getenv("DEBUG", "True").lower() == "true"
-    SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
+    DEBUG: bool
+    SECRET_KEY: str
     
     # File Upload Configuration
-    MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", "10485760"))  # 10MB
-    UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./data/uploads")
-    ALLOWED_EXTENSIONS = {'.pdf', '.docx', '.doc', '.txt'}
+    MAX_FILE_SIZE: int
+    UPLOAD_DIR: str
+    ALLOWED_EXTENSIONS: ClassVar[FrozenSet[str]] = frozenset({'.pdf', '.docx', '.doc', '.txt'})
     
     # Scoring Weights
-    HARD_MATCH_WEIGHT = float(os.getenv("HARD_MATCH_WEIGHT", "0.4"))
-    SEMANTIC_MATCH_WEIGHT = float(os.getenv("SEMANTIC_MATCH_WEIGHT", "0.6"))
+    HARD_MATCH_WEIGHT: float
+    SEMANTIC_MATCH_WEIGHT: float
     
     # Matching Thresholds
-    FUZZY_MATCH_THRESHOLD = 80
-    SEMANTIC_MATCH_THRESHOLD = 0.3
+    FUZZY_MATCH_THRESHOLD: ClassVar[int] = 80
+    SEMANTIC_MATCH_THRESHOLD: ClassVar[float] = 0.3
     
     # Verdict Thresholds
-    HIGH_FIT_THRESHOLD = 0.8
-    MEDIUM_FIT_THRESHOLD = 0.6
+    HIGH_FIT_THRESHOLD: ClassVar[float] = 0.8
+    MEDIUM_FIT_THRESHOLD: ClassVar[float] = 0.6
+    
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "Config":
+        """Build a configuration snapshot from the given environment"""
+        return cls(
+            GOOGLE_API_KEY=env.get("GOOGLE_API_KEY"),
+            DEFAULT_MODEL=env.get("DEFAULT_MODEL", "gemini-pro"),
+            EMBEDDING_MODEL=env.get("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2"),
+            DATABASE_URL=env.get("DATABASE_URL", "sqlite:///./resume_evaluation.db"),
+            DEBUG=env.get("DEBUG", "True").lower() == "true",
+            SECRET_KEY=env.get("SECRET_KEY", "your-secret-key-here"),
+            MAX_FILE_SIZE=int(env.get("MAX_FILE_SIZE", "10485760")),  # 10MB
+            UPLOAD_DIR=env.get("UPLOAD_DIR", "./data/uploads"),
+            HARD_MATCH_WEIGHT=float(env.get("HARD_MATCH_WEIGHT", "0.4")),
+            SEMANTIC_MATCH_WEIGHT=float(env.get("SEMANTIC_MATCH_WEIGHT", "0.6"))
+        )
+    
+    @staticmethod
+    def reload_env() -> "Config":
+        """Re-read the .env file over the current environment and rebuild CONFIG"""
+        load_dotenv(override=True)
+        return Config.reload()
+    
+    @staticmethod
+    def reload() -> "Config":
+        """Re-read the environment into CONFIG; modules that imported CONFIG by name keep the old snapshot"""
+        global CONFIG
+        CONFIG = Config.from_env()
+        return CONFIG
     
     @classmethod
-    def validate_config(cls):
-        """Validate configuration settings"""
+    def validate_config(cls) -> List[str]:
+        """Validate the configuration settings in CONFIG"""
         errors = []
         
-        if not cls.GOOGLE_API_KEY:
+        if not CONFIG.GOOGLE_API_KEY:
             errors.append("GOOGLE_API_KEY is required")
         
-        if cls.HARD_MATCH_WEIGHT + cls.SEMANTIC_MATCH_WEIGHT != 1.0:
+        if not math.isclose(CONFIG.HARD_MATCH_WEIGHT + CONFIG.SEMANTIC_MATCH_WEIGHT, 1.0, abs_tol=1e-9):
             errors.append("HARD_MATCH_WEIGHT + SEMANTIC_MATCH_WEIGHT must equal 1.0")
         
-        if cls.MAX_FILE_SIZE <= 0:
+        if CONFIG.MAX_FILE_SIZE <= 0:
             errors.append("MAX_FILE_SIZE must be positive")
         
         return errors
+
+CONFIG = Config.from_env()
@@ -0,0 +1,9 @@
+from typing import Iterable, List
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
+    """Lowercase, strip and dedupe a skill list, keeping each skill at its first position
+    
+    Skills listed twice (e.g. "Python" and "python") count once towards the exact and fuzzy
+    match scores.
+    """
+    return list(dict.fromkeys(skill.strip().lower() for skill in skills))
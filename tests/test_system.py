@@ -6,22 +6,43 @@ Test script for the Resume Evaluation System
 import sys
 import os
 import json
+import logging
 import requests
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path
+# Add src to path; each test imports the module it exercises, so a single test
+# does not pay for loading the heavier models used by the others
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from parsers.resume_parser import ResumeParser
-from parsers.jd_parser import JobDescriptionParser
-from matching.hard_matching import HardMatching
-from matching.semantic_matching import SemanticMatching
-from scoring.scoring_engine import ScoringEngine
+# Test output goes through one logger; -q on the command line shows only warnings and failures
+log = logging.getLogger("resume_tests")
+log.setLevel(logging.INFO)
+if not log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+# The modules under test configure the root logger; keep test output from appearing twice
+log.propagate = False
+
+# One keep-alive session per thread: requests.Session is not thread-safe and the endpoint
+# probes run concurrently
+_local = threading.local()
+
+def _session():
+    """Return the calling thread's API session"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
 
 def test_resume_parser():
     """Test resume parser functionality"""
-    print("🧪 Testing Resume Parser...")
+    log.info("🧪 Testing Resume Parser...")
     
+    from parsers.resume_parser import ResumeParser
     parser = ResumeParser()
     
     # Test with sample resume text
@@ -57,32 +78,89 @@ def test_resume_parser():
     - Deployed on AWS
     """
     
-    # Create a temporary file
-    with open("temp_resume.txt", "w") as f:
+    # Create a temporary file in the system temp directory
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
         f.write(sample_resume_text)
+        temp_path = f.name
     
     try:
-        result = parser.parse_resume("temp_resume.txt")
+        result = parser.parse_resume(temp_path)
         
-        print(f"✅ Resume parsed successfully")
-        print(f"   - Skills found: {len(result.get('skills', []))}")
-        print(f"   - Experience entries: {len(result.get('experience', []))}")
-        print(f"   - Education entries: {len(result.get('education', []))}")
-        print(f"   - Projects: {len(result.get('projects', []))}")
+        log.info(f"✅ Resume parsed successfully")
+        log.info(f"   - Skills found: {len(result.get('skills', []))}")
+        log.info(f"   - Experience entries: {len(result.get('experience', []))}")
+        log.info(f"   - Education entries: {len(result.get('education', []))}")
+        log.info(f"   - Projects: {len(result.get('projects', []))}")
         
         return True
     except Exception as e:
-        print(f"❌ Resume parser test failed: {e}")
+        log.error(f"❌ Resume parser test failed: {e}")
         return False
     finally:
         # Clean up
-        if os.path.exists("temp_resume.txt"):
-            os.remove("temp_resume.txt")
+        os.unlink(temp_path)
+
+def test_resume_batch():
+    """Test that batch parsing in worker processes keeps the order of the files"""
+    log.info("🧪 Testing Resume Batch Parsing...")
+    
+    import fitz
+    from parsers.resume_parser import ResumeParser
+    parser = ResumeParser()
+    
+    emails = [f"candidate{index}@example.com" for index in range(3)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for index, email in enumerate(emails):
+            doc = fitz.open()
+            doc.new_page().insert_text((72, 72), f"Candidate {index}\nEmail: {email}\nSkills: Python, Docker")
+            path = os.path.join(temp_dir, f"resume{index}.pdf")
+            doc.save(path)
+            doc.close()
+            paths.append(path)
+        
+        results = parser.parse_resumes(paths, max_workers=2)
+    
+    found = [result.get("contact_info", {}).get("email") for result in results]
+    if found != emails:
+        log.error(f"❌ Batch results out of order or incomplete: {found}")
+        return False
+    
+    log.info(f"✅ Parsed {len(results)} resumes in worker processes")
+    return True
+
+def test_unicode_digits():
+    """Test that non-ASCII digits and lone surrogates get through the prefilter"""
+    log.info("🧪 Testing Non-ASCII Digits...")
+    
+    from parsers.resume_parser import ResumeParser
+    parser = ResumeParser()
+    
+    education = parser.extract_education("Bachelor of Engineering, Tokyo University ２０１９")
+    if len(education) != 2:
+        log.error(f"❌ Education with full-width year not found: {education}")
+        return False
+    
+    # A lone surrogate from a bad decode cannot be passed to the Hyperscan prefilter
+    education = parser.extract_education("Bachelor of Engineering " + chr(0xd835) + ", Tokyo University 2019")
+    if len(education) != 2:
+        log.error(f"❌ Education next to a lone surrogate not found: {education}")
+        return False
+    
+    from parsers.jd_parser import JobDescriptionParser
+    parsed_jd = JobDescriptionParser().parse_job_description("Role: Data Engineer\nWe need " + chr(0xd835) + " Python")
+    if "error" in parsed_jd:
+        log.error(f"❌ Job description with a lone surrogate not parsed: {parsed_jd['error']}")
+        return False
+    
+    log.info("✅ Full-width digits and lone surrogates matched")
+    return True
 
 def test_jd_parser():
     """Test job description parser functionality"""
-    print("🧪 Testing Job Description Parser...")
+    log.info("🧪 Testing Job Description Parser...")
     
+    from parsers.jd_parser import JobDescriptionParser
     parser = JobDescriptionParser()
     
     sample_jd_text = """
@@ -116,21 +194,78 @@ def test_jd_parser():
     try:
         result = parser.parse_job_description(sample_jd_text)
         
-        print(f"✅ Job description parsed successfully")
-        print(f"   - Job title: {result.get('job_title', 'N/A')}")
-        print(f"   - Required skills: {len(result.get('required_skills', []))}")
-        print(f"   - Preferred skills: {len(result.get('preferred_skills', []))}")
-        print(f"   - Qualifications: {len(result.get('qualifications', []))}")
+        log.info(f"✅ Job description parsed successfully")
+        log.info(f"   - Job title: {result.get('job_title', 'N/A')}")
+        log.info(f"   - Required skills: {len(result.get('required_skills', []))}")
+        log.info(f"   - Preferred skills: {len(result.get('preferred_skills', []))}")
+        log.info(f"   - Qualifications: {len(result.get('qualifications', []))}")
         
         return True
     except Exception as e:
-        print(f"❌ Job description parser test failed: {e}")
+        log.error(f"❌ Job description parser test failed: {e}")
+        return False
+
+def test_jd_sections():
+    """Test that words like "compensation" or "packages" inside a section do not cut it off"""
+    log.info("🧪 Testing Job Description Sections...")
+    
+    from parsers.jd_parser import JobDescriptionParser
+    parser = JobDescriptionParser()
+    
+    responsibilities = parser.extract_responsibilities(
+        "Responsibilities: Own the compensation reporting pipeline and build dashboards."
+    )
+    if responsibilities != ["own the compensation reporting pipeline and build dashboards"]:
+        log.error(f"❌ Responsibilities cut short: {responsibilities}")
+        return False
+    
+    preferred_skills = parser.extract_preferred_skills(
+        "Nice to have: familiarity with npm packages, React and GraphQL."
+    )
+    if sorted(preferred_skills) != ["graphql", "react"]:
+        log.error(f"❌ Preferred skills cut short: {preferred_skills}")
+        return False
+    
+    log.info("✅ Section bodies run to the end of the sentence")
+    return True
+
+def test_jd_unicode_text():
+    """Test that non-ASCII text parses the same whichever regex engine is installed"""
+    log.info("🧪 Testing Job Description Unicode Text...")
+    
+    from parsers.jd_parser import JobDescriptionParser
+    parser = JobDescriptionParser()
+    
+    cases = [
+        ("at least ３ years of experience", (3, None)),
+        ("３-５ years of experience", (3, 5))
+    ]
+    for text, expected in cases:
+        experience = parser.extract_experience_requirements(text)
+        if (experience["min_years"], experience["max_years"]) != expected:
+            log.error(f"❌ Years not read from {text!r}: {experience}")
+            return False
+    
+    title = parser.extract_job_title("Role: İnfrastructure Engineer\n")
+    if title != "İnfrastructure Engineer":
+        log.error(f"❌ Title not read: {title}")
         return False
+    
+    # Lone surrogates from a bad decode cannot be handed to RE2
+    surrogate_text = "We need " + chr(0xd835) + " Python, 3+ years of experience"
+    experience = parser.extract_experience_requirements(parser.clean_text(surrogate_text))
+    if experience["min_years"] != 3:
+        log.error(f"❌ Years not read from text with a lone surrogate: {experience}")
+        return False
+    
+    log.info("✅ Full-width digits, non-ASCII letters and lone surrogates matched")
+    return True
 
 def test_hard_matching():
     """Test hard matching functionality"""
-    print("🧪 Testing Hard Matching...")
+    log.info("🧪 Testing Hard Matching...")
     
+    from matching.hard_matching import HardMatching
     matcher = HardMatching()
     
     # Sample resume data
@@ -154,25 +289,50 @@ def test_hard_matching():
     try:
         result = matcher.calculate_hard_match_score(resume_data, jd_data)
         
-        print(f"✅ Hard matching completed successfully")
-        print(f"   - Hard match score: {result.get('hard_match_score', 0):.2f}")
-        print(f"   - Exact skill matches: {len(result.get('exact_skill_match', {}).get('exact_matches', []))}")
-        print(f"   - Education score: {result.get('education_match', {}).get('education_score', 0):.2f}")
+        log.info(f"✅ Hard matching completed successfully")
+        log.info(f"   - Hard match score: {result.get('hard_match_score', 0):.2f}")
+        log.info(f"   - Exact skill matches: {len(result.get('exact_skill_match', {}).get('exact_matches', []))}")
+        log.info(f"   - Education score: {result.get('education_match', {}).get('education_score', 0):.2f}")
         
         return True
     except Exception as e:
-        print(f"❌ Hard matching test failed: {e}")
+        log.error(f"❌ Hard matching test failed: {e}")
+        return False
+
+def test_duplicate_skills():
+    """Test that a skill listed twice with different casing is scored once"""
+    log.info("🧪 Testing Duplicate Skills...")
+    
+    from matching.hard_matching import HardMatching
+    matcher = HardMatching()
+    
+    resume_data = {"skills": ["python", "git"]}
+    jd_data = {"required_skills": ["Python", "python", "Java", " java ", "Git"]}
+    
+    result = matcher.calculate_hard_match_score(resume_data, jd_data)
+    exact = result.get("exact_skill_match", {})
+    if exact.get("total_required_skills") != 3 or abs(exact.get("exact_match_score", 0) - 2 / 3) > 1e-9:
+        log.error(f"❌ Duplicate skills not merged: {exact}")
+        return False
+    
+    # Normalizing keeps the job description's order
+    if exact.get("exact_matches") != ["python", "git"]:
+        log.error(f"❌ Matched skills out of order: {exact.get('exact_matches')}")
         return False
+    
+    log.info("✅ Duplicate skills counted once")
+    return True
 
 def test_semantic_matching():
     """Test semantic matching functionality"""
-    print("🧪 Testing Semantic Matching...")
+    log.info("🧪 Testing Semantic Matching...")
     
     # Skip if no Google API key
     if not os.getenv("GOOGLE_API_KEY"):
-        print("⚠️  Skipping semantic matching test (no Google API key)")
+        log.warning("⚠️  Skipping semantic matching test (no Google API key)")
         return True
     
+    from matching.semantic_matching import SemanticMatching
     matcher = SemanticMatching()
     
     # Sample data
@@ -188,20 +348,21 @@ def test_semantic_matching():
     try:
         result = matcher.calculate_semantic_match_score(resume_data, jd_data)
         
-        print(f"✅ Semantic matching completed successfully")
-        print(f"   - Semantic score: {result.get('semantic_score', 0):.2f}")
-        print(f"   - Overall similarity: {result.get('overall_similarity', 0):.2f}")
-        print(f"   - Semantic skill matches: {len(result.get('semantic_skills', {}).get('semantic_matches', []))}")
+        log.info(f"✅ Semantic matching completed successfully")
+        log.info(f"   - Semantic score: {result.get('semantic_score', 0):.2f}")
+        log.info(f"   - Overall similarity: {result.get('overall_similarity', 0):.2f}")
+        log.info(f"   - Semantic skill matches: {len(result.get('semantic_skills', {}).get('semantic_matches', []))}")
         
         return True
     except Exception as e:
-        print(f"❌ Semantic matching test failed: {e}")
+        log.error(f"❌ Semantic matching test failed: {e}")
         return False
 
 def test_scoring_engine():
     """Test scoring engine functionality"""
-    print("🧪 Testing Scoring Engine...")
+    log.info("🧪 Testing Scoring Engine...")
     
+    from scoring.scoring_engine import ScoringEngine
     engine = ScoringEngine()
     
     # Sample hard match results
@@ -225,66 +386,106 @@ def test_scoring_engine():
         verdict = engine.determine_verdict(final_score)
         percentage = engine.convert_to_percentage(final_score)
         
-        print(f"✅ Scoring engine completed successfully")
-        print(f"   - Final score: {final_score:.2f}")
-        print(f"   - Percentage: {percentage}%")
-        print(f"   - Verdict: {verdict}")
+        log.info(f"✅ Scoring engine completed successfully")
+        log.info(f"   - Final score: {final_score:.2f}")
+        log.info(f"   - Percentage: {percentage}%")
+        log.info(f"   - Verdict: {verdict}")
         
         return True
     except Exception as e:
-        print(f"❌ Scoring engine test failed: {e}")
+        log.error(f"❌ Scoring engine test failed: {e}")
         return False
 
+def test_config():
+    """Test that configuration constants read the same on the class and on CONFIG"""
+    log.info("🧪 Testing Configuration...")
+    
+    from utils.config import Config, CONFIG
+    
+    if '.pdf' not in Config.ALLOWED_EXTENSIONS or '.exe' in CONFIG.ALLOWED_EXTENSIONS:
+        log.error(f"❌ Unexpected allowed extensions: {Config.ALLOWED_EXTENSIONS}")
+        return False
+    
+    if not isinstance(CONFIG.DEBUG, bool) or Config.FUZZY_MATCH_THRESHOLD != CONFIG.FUZZY_MATCH_THRESHOLD:
+        log.error("❌ Configuration values not readable")
+        return False
+    
+    # Environment values live on CONFIG only; reading them off the class must fail loudly
+    if hasattr(Config, "GOOGLE_API_KEY") or hasattr(Config, "MAX_FILE_SIZE"):
+        log.error("❌ Environment values readable on the Config class")
+        return False
+    
+    if not isinstance(Config.validate_config(), list):
+        log.error("❌ Config.validate_config() did not return a list of errors")
+        return False
+    
+    log.info("✅ Configuration loaded")
+    return True
+
+def wait_for_backend(base_url, timeout=2.0):
+    """Poll the health endpoint until the backend accepts connections or the timeout passes"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _session().get(f"{base_url}/health", timeout=(0.2, 5))
+            return True
+        except requests.exceptions.RequestException:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
 def test_api_endpoints():
     """Test API endpoints"""
-    print("🧪 Testing API Endpoints...")
+    log.info("🧪 Testing API Endpoints...")
     
     base_url = "http://localhost:8000"
     
+    # Health, root and dashboard stats endpoints
+    endpoints = [("Health", "/health"), ("Root", "/"), ("Dashboard stats", "/dashboard/stats")]
+    
     try:
-        # Test health endpoint
-        response = requests.get(f"{base_url}/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ Health endpoint working")
-        else:
-            print(f"❌ Health endpoint failed: {response.status_code}")
+        # A backend started alongside the tests may still be booting
+        if not wait_for_backend(base_url):
+            log.warning("⚠️  API server not running. Start the server with: python start_server.py")
             return False
         
-        # Test root endpoint
-        response = requests.get(f"{base_url}/", timeout=5)
-        if response.status_code == 200:
-            print("✅ Root endpoint working")
-        else:
-            print(f"❌ Root endpoint failed: {response.status_code}")
-            return False
+        # The requests are independent, so send them at once and report in order
+        # Connecting to localhost is instant when the server is up; only reads get the long budget
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            responses = list(executor.map(lambda endpoint: _session().get(f"{base_url}{endpoint[1]}", timeout=(0.2, 5)), endpoints))
         
-        # Test dashboard stats
-        response = requests.get(f"{base_url}/dashboard/stats", timeout=5)
-        if response.status_code == 200:
-            print("✅ Dashboard stats endpoint working")
-        else:
-            print(f"❌ Dashboard stats endpoint failed: {response.status_code}")
-            return False
+        for (name, _), response in zip(endpoints, responses):
+            if response.status_code == 200:
+                log.info(f"✅ {name} endpoint working")
+            else:
+                log.error(f"❌ {name} endpoint failed: {response.status_code}")
+                return False
         
         return True
     except requests.exceptions.ConnectionError:
-        print("⚠️  API server not running. Start the server with: python start_server.py")
+        log.warning("⚠️  API server not running. Start the server with: python start_server.py")
         return False
     except Exception as e:
-        print(f"❌ API test failed: {e}")
+        log.error(f"❌ API test failed: {e}")
         return False
 
 def run_all_tests():
     """Run all tests"""
-    print("🚀 Running Resume Evaluation System Tests")
-    print("=" * 50)
+    log.info("🚀 Running Resume Evaluation System Tests")
+    log.info("=" * 50)
     
     tests = [
         test_resume_parser,
+        test_resume_batch,
+        test_unicode_digits,
         test_jd_parser,
+        test_jd_sections,
+        test_jd_unicode_text,
         test_hard_matching,
+        test_duplicate_skills,
         test_semantic_matching,
         test_scoring_engine,
+        test_config,
         test_api_endpoints
     ]
     
@@ -295,21 +496,23 @@ def run_all_tests():
         try:
             if test():
                 passed += 1
-            print()
+            log.info("")
         except Exception as e:
-            print(f"❌ Test {test.__name__} crashed: {e}")
-            print()
+            log.error(f"❌ Test {test.__name__} crashed: {e}")
+            log.info("")
     
-    print("=" * 50)
-    print(f"📊 Test Results: {passed}/{total} tests passed")
+    log.info("=" * 50)
+    log.info(f"📊 Test Results: {passed}/{total} tests passed")
     
     if passed == total:
-        print("🎉 All tests passed!")
+        log.info("🎉 All tests passed!")
         return True
     else:
-        print("⚠️  Some tests failed. Please check the errors above.")
+        log.warning("⚠️  Some tests failed. Please check the errors above.")
         return False
 
 if __name__ == "__main__":
+    if "-q" in sys.argv[1:]:
+        log.setLevel(logging.WARNING)
     success = run_all_tests()
     sys.exit(0 if success else 1)